@@ -10,10 +10,7 @@ app.add_middleware(GlobalsMiddleware)
 
 
 async def set_globals() -> None:
-    g.username = "JohnDoe"
-    g.request_id = "123456"
-    g.is_admin = True
-    g.to_pop = "dispensable"
+    g.setmany(username="JohnDoe", request_id="123456", is_admin=True, to_pop="dispensable")
 
 
 @app.get("/", dependencies=[Depends(set_globals)])
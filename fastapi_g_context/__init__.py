@@ -1,6 +1,13 @@
-from .fastapi_g import GlobalsMiddleware, g
+from .fastapi_g import GlobalsAttributeError, GlobalsMiddleware, g, g_contains, g_get, g_items, g_keys, g_pop, g_values
 
 __all__ = [
+    "GlobalsAttributeError",
     "GlobalsMiddleware",
-    "g"
+    "g",
+    "g_get",
+    "g_pop",
+    "g_items",
+    "g_keys",
+    "g_values",
+    "g_contains"
 ]
@@ -1,21 +1,30 @@
-from contextvars import ContextVar, copy_context
+from contextvars import ContextVar
 from starlette.types import ASGIApp, Receive, Scope, Send
-from typing import Dict, Any, Iterator, Tuple
+from typing import Dict, Any, ClassVar, ItemsView, Iterator, KeysView, ValuesView
+
+class GlobalsAttributeError(AttributeError):
+    """
+    AttributeError raised when accessing a variable that is not set in globals.
+
+    Its only argument is the variable name, the message is formatted lazily when rendered.
+    """
+
+    def __str__(self) -> str:
+        return f"'{self.args[0]}' variable does not exist in globals, make sure to set it before trying to use it"
+
 
 class Globals:
     """
     A class for managing global variables with context isolation.
 
     Provides methods to set, get, and manage variables in a request-specific context.
+    The variable store is shared by all instances, use the module-level `g` instance.
     """
 
-    __slots__ = ("_context_data",)
-
-    _context_data: ContextVar[Dict[str, Any]]
+    __slots__ = ()
 
-    def __init__(self) -> None:
-        """Initialize the Globals instance with an empty variable store."""
-        object.__setattr__(self, '_context_data', ContextVar("context_data", default={}))
+    # Shared by all instances, so creating a Globals instance needs no setup
+    _context_data: ClassVar[ContextVar[Dict[str, Any]]] = ContextVar("context_data", default={})
 
     def clear(self) -> None:
         """Clear all context variables from the store."""
@@ -29,7 +38,7 @@ class Globals:
             name: The name of the variable.
 
         Raises:
-            AttributeError: If the variable is not found.
+            GlobalsAttributeError: If the variable is not found.
 
         Returns:
             The value of the variable.
@@ -37,7 +46,7 @@ class Globals:
         try:
             return self._context_data.get()[name]
         except KeyError:
-            raise AttributeError(f"'{name}' variable does not exist in globals, make sure to set it before trying to use it")
+            raise GlobalsAttributeError(name)
 
     def __setattr__(self, name: str, value: Any) -> None:
         """
@@ -47,8 +56,19 @@ class Globals:
             name: The name of the variable.
             value: The value to set.
         """
+        # A single ContextVar holds the whole store, so setting a variable is a
+        # plain dict assignment after one ContextVar.get(), with no Token allocated
         self._context_data.get()[name] = value
 
+    def setmany(self, /, **kwargs: Any) -> None:
+        """
+        Set the values of multiple variables at once.
+
+        Args:
+            **kwargs: The variable names and the values to set.
+        """
+        self._context_data.get().update(kwargs)
+
     def get(self, name: str, default: Any = None) -> Any:
         """
         Retrieve the value of a variable with an optional default value.
@@ -87,41 +107,80 @@ class Globals:
         """
         return name in self._context_data.get()
 
-    def keys(self) -> Iterator[str]:
+    def __getitem__(self, name: str) -> Any:
+        """
+        Retrieve the value of a variable by key, so that `dict(g)` works.
+
+        Args:
+            name: The name of the variable.
+
+        Raises:
+            KeyError: If the variable is not found.
+
+        Returns:
+            The value of the variable.
+        """
+        return self._context_data.get()[name]
+
+    def __iter__(self) -> Iterator[str]:
         """
         Return an iterator over the variable names.
 
         Returns:
             An iterator over the variable names.
         """
-        return iter(self._context_data.get().keys())
+        return iter(self._context_data.get())
+
+    def __len__(self) -> int:
+        """
+        Return the number of variables set.
+
+        Returns:
+            The number of variables.
+        """
+        return len(self._context_data.get())
 
-    def values(self) -> Iterator[Any]:
+    def keys(self) -> KeysView[str]:
         """
-        Return an iterator over the variable values.
+        Return a view of the variable names.
 
         Returns:
-            An iterator over the variable values.
+            A view of the variable names.
         """
-        return iter(self._context_data.get().values())
+        return self._context_data.get().keys()
 
-    def items(self) -> Iterator[Tuple[str, Any]]:
+    def values(self) -> ValuesView[Any]:
         """
-        Return an iterator over the variable name-value pairs.
+        Return a view of the variable values.
 
         Returns:
-            An iterator over tuples containing variable names and values.
+            A view of the variable values.
         """
-        return iter(self._context_data.get().items())
+        return self._context_data.get().values()
 
-    def to_dict(self) -> Dict[str, Any]:
+    def items(self) -> ItemsView[str, Any]:
+        """
+        Return a view of the variable name-value pairs.
+
+        Returns:
+            A view of tuples containing variable names and values.
+        """
+        return self._context_data.get().items()
+
+    def to_dict(self, copy: bool = False) -> Dict[str, Any]:
         """
         Return all variables and their current values as a dictionary.
 
+        Args:
+            copy: Whether to return a copy instead of the request-scoped dictionary.
+                Pass True if the returned dictionary is going to be modified, since
+                changes to the request-scoped dictionary affect the globals.
+
         Returns:
             A dictionary of variable names and their values.
         """
-        return dict(self._context_data.get())
+        data = self._context_data.get()
+        return dict(data) if copy else data
 
 
 class GlobalsMiddleware:
@@ -143,20 +202,27 @@ class GlobalsMiddleware:
         """
         Handle an ASGI request.
 
-        Clears the global context and runs the ASGI application in a new context.
+        Gives the request a fresh global variables store and runs the ASGI application.
 
         Args:
             scope: The ASGI scope.
             receive: The ASGI receive function.
             send: The ASGI send function.
         """
-        # Clear global variables for the request
-        g.clear()
-        # Create a new context for the request
-        ctx = copy_context()
-        # Run the original ASGI app in the new context
-        await ctx.run(self.app, scope, receive, send)
+        # Set a fresh store for the request, only this variable needs isolating.
+        # It is deliberately not reset afterwards, so that exception handlers
+        # running in outer middlewares can still read the request's globals.
+        g._context_data.set({})
+        await self.app(scope, receive, send)
 
 
 # Global instance of Globals to be used by the middleware and users
 g = Globals()
+
+# Pre-bound methods of g, to skip the attribute lookup in hot code paths
+g_get = g.get
+g_pop = g.pop
+g_items = g.items
+g_keys = g.keys
+g_values = g.values
+g_contains = g.__contains__
@@ -1,5 +1,6 @@
 from fastapi.testclient import TestClient
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
+from fastapi.responses import JSONResponse
 from fastapi_g_context import GlobalsMiddleware, g
 import asyncio
 import pytest
@@ -63,6 +64,39 @@ async def no_globals_with_delay_view():
     }
 
 
+@app.get("/set_globals_sync", dependencies=[Depends(initialize_global_context)])
+def set_globals_sync_view():
+    return {
+        "global_keys": list(g.keys()),
+        "global_values": list(g.values()),
+        "global_data": g.to_dict(),
+    }
+
+
+def initialize_global_context_sync():
+    g.username = "JaneDoe"
+    g.request_id = "654321"
+
+
+@app.get("/set_globals_in_sync_dependency", dependencies=[Depends(initialize_global_context_sync)])
+async def set_globals_in_sync_dependency_view():
+    return {
+        "global_keys": list(g.keys()),
+        "global_values": list(g.values()),
+        "global_data": g.to_dict(),
+    }
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    return JSONResponse(status_code=500, content={"request_id": g.get("request_id")})
+
+
+@app.get("/set_globals_and_raise", dependencies=[Depends(initialize_global_context)])
+async def set_globals_and_raise_view():
+    raise RuntimeError("boom")
+
+
 client = TestClient(app)
 
 
@@ -171,3 +205,29 @@ async def test_concurrent_requests_with_sleep_delay():
 
     assert response_2["global_keys"] == []
     assert response_2["global_data"] == {}
+
+
+def test_set_globals_in_sync_endpoint():
+    response = client.get("/set_globals_sync")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["global_keys"]) == {"username", "request_id", "is_admin", "to_remove"}
+    assert data["global_data"]["username"] == "JohnDoe"
+
+    response = client.get("/no_globals")
+    assert response.status_code == 200
+    assert response.json()["global_data"] == {}
+
+
+def test_set_globals_in_sync_dependency():
+    response = client.get("/set_globals_in_sync_dependency")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["global_data"] == {"username": "JaneDoe", "request_id": "654321"}
+
+
+def test_globals_available_in_exception_handler():
+    error_client = TestClient(app, raise_server_exceptions=False)
+    response = error_client.get("/set_globals_and_raise")
+    assert response.status_code == 500
+    assert response.json() == {"request_id": "123456"}
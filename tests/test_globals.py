@@ -1,5 +1,7 @@
 import pytest
-from fastapi_g_context import g
+from collections.abc import ItemsView, KeysView, ValuesView
+from fastapi_g_context.fastapi_g import Globals
+from fastapi_g_context import GlobalsAttributeError, g, g_contains, g_get, g_items, g_keys, g_pop, g_values
 
 
 @pytest.fixture(autouse=True)
@@ -14,10 +16,22 @@ def test_set_and_get_attribute():
 
 
 def test_get_non_existing_attribute():
-    with pytest.raises(AttributeError):
+    with pytest.raises(AttributeError, match="'non_existing' variable does not exist in globals"):
         _ = g.non_existing
 
 
+def test_non_existing_attribute_error():
+    with pytest.raises(GlobalsAttributeError) as exc_info:
+        _ = g.non_existing
+    assert isinstance(exc_info.value, AttributeError)
+    assert exc_info.value.args == ("non_existing",)
+
+
+def test_getattr_with_default():
+    assert getattr(g, "non_existing", "default_value") == "default_value"
+    assert not hasattr(g, "non_existing")
+
+
 def test_get_with_default():
     assert g.get("non_existing", "default_value") == "default_value"
     assert g.get("non_existing") is None
@@ -65,3 +79,94 @@ def test_to_dict():
     g.key1 = "value1"
     g.key2 = "value2"
     assert g.to_dict() == {"key1": "value1", "key2": "value2"}
+
+
+def test_len():
+    assert len(g) == 0
+    g.key1 = "value1"
+    g.key2 = "value2"
+    assert len(g) == 2
+
+
+def test_truthiness_follows_len():
+    assert not g
+    g.key1 = "value1"
+    assert g
+
+
+def test_iter():
+    g.key1 = "value1"
+    g.key2 = "value2"
+    assert list(g) == ["key1", "key2"]
+
+
+def test_getitem():
+    g.key1 = "value1"
+    assert g["key1"] == "value1"
+    with pytest.raises(KeyError):
+        _ = g["non_existing"]
+
+
+def test_dict_conversion():
+    g.key1 = "value1"
+    g.key2 = "value2"
+    assert dict(g) == {"key1": "value1", "key2": "value2"}
+
+
+def test_to_dict_copy():
+    g.key1 = "value1"
+    data = g.to_dict(copy=True)
+    data["key2"] = "value2"
+    assert "key2" not in g
+
+
+def test_to_dict_without_copy():
+    g.key1 = "value1"
+    data = g.to_dict()
+    assert data is g.to_dict()
+    data["key2"] = "value2"
+    assert g.key2 == "value2"
+
+
+def test_to_dict_without_copy_reflects_later_changes():
+    g.key1 = "value1"
+    data = g.to_dict()
+    g.key2 = "value2"
+    g.pop("key1")
+    assert data == {"key2": "value2"}
+
+
+def test_setmany():
+    g.key1 = "value1"
+    g.setmany(key1="new_value1", key2="value2")
+    assert g.key1 == "new_value1"
+    assert g.key2 == "value2"
+
+
+def test_setmany_with_self_name():
+    g.setmany(self="value")
+    assert g.self == "value"
+
+
+def test_bound_shortcuts():
+    g.key1 = "value1"
+    assert g_get("key1") == "value1"
+    assert g_contains("key1")
+    assert list(g_keys()) == ["key1"]
+    assert list(g_values()) == ["value1"]
+    assert dict(g_items()) == {"key1": "value1"}
+    assert g_pop("key1") == "value1"
+    assert not g_contains("key1")
+
+
+def test_views_are_returned():
+    g.key1 = "value1"
+    assert isinstance(g.keys(), KeysView)
+    assert isinstance(g.values(), ValuesView)
+    assert isinstance(g.items(), ItemsView)
+    assert len(g.items()) == 1
+
+
+def test_instances_share_store():
+    g.key1 = "value1"
+    assert Globals().key1 == "value1"